@@ -0,0 +1,62 @@
+import multiprocessing as mp
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import polars as pl
+from step_1_fetch_data import combine_season_files, fetch_pbp_data, fetch_pbp_parallel
+
+YEARS = list(range(2000, 2026))
+# Set to a directory of pbp_<year>.parquet files to benchmark offline
+MIRROR = None
+WORKERS = 4
+
+def run_serial(out_dir: Path):
+    # The original step_1: every season in memory, then a single write
+    if MIRROR is None:
+        df = fetch_pbp_data(YEARS)
+    else:
+        df = pl.concat([pl.read_parquet(Path(MIRROR) / f"pbp_{year}.parquet") for year in YEARS], how="diagonal_relaxed")
+    df.write_parquet(out_dir / "pbp_raw.parquet")
+
+def run_parallel(out_dir: Path):
+    mirror = None if MIRROR is None else Path(MIRROR)
+    paths, failed = fetch_pbp_parallel(YEARS, out_dir=out_dir / "seasons", mirror=mirror, max_workers=WORKERS)
+    if failed:
+        raise RuntimeError(f"Failed seasons: {failed}")
+    combine_season_files(paths, out_dir / "pbp_raw.parquet")
+
+def measure(func, queue):
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        func(Path(tmp))
+        end = time.perf_counter()
+
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+    queue.put((end - start, peak_mb))
+
+def benchmark(func, label):
+    # A fresh process per run keeps it a cold bootstrap (nothing in nflreadpy's
+    # memory cache) and gives each mode its own peak-memory reading.
+    # A filesystem cache (NFLREADPY_CACHE=filesystem) would make runs warm.
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=measure, args=(func, queue))
+    process.start()
+    elapsed, peak_mb = queue.get()
+    process.join()
+
+    print(f"{label}")
+    print(f"  time:     {elapsed:.3f}s")
+    print(f"  peak RSS: {peak_mb:.0f} MB")
+    print()
+
+if __name__ == "__main__":
+    benchmark(run_serial, "Serial (single load_pbp call)")
+    benchmark(run_parallel, f"Parallel ({WORKERS} workers, per-season files)")
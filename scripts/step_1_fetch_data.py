@@ -1,5 +1,15 @@
+import argparse
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
 import nflreadpy as nfl
 import polars as pl
+from nflreadpy.config import get_config, update_config
+
+SEASON_DIR = Path("data/pbp_seasons")
+RAW_PATH = Path("data/pbp_raw.parquet")
 
 def fetch_pbp_data(years: list[int]) -> pl.DataFrame:
     """
@@ -11,8 +21,125 @@ def fetch_pbp_data(years: list[int]) -> pl.DataFrame:
     print(f"Loaded {len(pbp)} plays")
     return pbp
 
+def save_season(year: int, path: Path, mirror: Path | None = None) -> None:
+    """
+    Put a single season at path, either downloaded with nflreadpy or copied
+    from a local mirror directory holding one pbp_<year>.parquet file per
+    season. Mirror files are copied as-is, never parsed.
+    """
+    if mirror is None:
+        nfl.load_pbp(seasons=year).write_parquet(path)
+        return
+    source = mirror / f"pbp_{year}.parquet"
+    if not source.is_file():
+        raise FileNotFoundError(f"No mirror file for season {year}: {source}")
+    if source.resolve() != path.resolve():
+        shutil.copyfile(source, path)
+
+def fetch_season_to_file(year: int, out_dir: Path, mirror: Path | None = None,
+                         retries: int = 3, backoff: float = 2.0) -> Path:
+    """
+    Fetch one season into its own parquet file, retrying this season alone
+    on network or IO errors. A missing mirror file fails straight away.
+    """
+    if retries < 1:
+        raise ValueError(f"retries must be at least 1, got {retries}")
+    path = out_dir / f"pbp_{year}.parquet"
+    for attempt in range(1, retries + 1):
+        try:
+            save_season(year, path, mirror)
+            return path
+        except FileNotFoundError:
+            raise
+        except OSError as exc:
+            if attempt == retries:
+                raise
+            print(f"Season {year} failed ({exc}), retrying ({attempt}/{retries - 1})")
+            time.sleep(backoff * attempt)
+    raise RuntimeError(f"Season {year} was not fetched after {retries} attempts")
+
+def fetch_pbp_parallel(years: list[int], out_dir: Path = SEASON_DIR, mirror: Path | None = None,
+                       max_workers: int = 4, retries: int = 3) -> tuple[list[Path], list[int]]:
+    """
+    Fetch seasons concurrently with a bounded thread pool. Each season is
+    written to disk as soon as it arrives and nflreadpy's in-memory cache
+    (if in use) is switched off, so at most max_workers seasons are held in
+    memory at once. Returns the paths that were written and the seasons
+    that failed.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if retries < 1:
+        raise ValueError(f"retries must be at least 1, got {retries}")
+    if mirror is None and get_config().cache_mode == "memory":
+        # The memory cache would keep every season alive for the whole run;
+        # a filesystem cache is left alone since it is what makes re-runs cheap
+        update_config(cache_mode="off")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written, failed = [], []
+    # All workers share nflreadpy's module-level downloader and its single
+    # requests.Session. Session isn't documented as thread-safe, but the only
+    # state it touches per request is a headers.update() with the same fixed
+    # User-Agent/Accept values, and connections come from urllib3's
+    # thread-safe pool, so a handful of threads sharing it is acceptable here.
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(fetch_season_to_file, year, out_dir, mirror, retries): year
+            for year in years
+        }
+        for future in as_completed(futures):
+            year = futures[future]
+            try:
+                path = future.result()
+            except Exception as exc:
+                print(f"Giving up on season {year}: {exc}")
+                failed.append(year)
+                continue
+            print(f"Wrote {path}")
+            written.append(path)
+    return sorted(written), sorted(failed)
+
+def combine_season_files(paths: list[Path], out_path: Path = RAW_PATH) -> None:
+    """
+    Stream the per-season files into a single parquet file without
+    materialising every season in memory. Columns that only exist in
+    some seasons are filled with nulls. The output is written to a
+    temporary file first, so a failed write leaves out_path untouched.
+    """
+    frames = [pl.scan_parquet(path) for path in paths]
+    tmp_path = out_path.with_name(f"{out_path.name}.tmp")
+    try:
+        pl.concat(frames, how="diagonal_relaxed").sink_parquet(tmp_path)
+        tmp_path.replace(out_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch NFL play-by-play data")
+    parser.add_argument("--parallel", action="store_true", help="fetch seasons concurrently, one file per season")
+    parser.add_argument("--workers", type=positive_int, default=4, help="max seasons fetched at once")
+    parser.add_argument("--retries", type=positive_int, default=3, help="attempts per season before giving up")
+    parser.add_argument("--mirror", type=Path, help="local directory of pbp_<year>.parquet files to read instead of nflreadpy")
+    parser.add_argument("--allow-partial", action="store_true", help="write pbp_raw.parquet even if some seasons failed")
+    args = parser.parse_args()
+
     # Example: 2000 to 2025
     years = list(range(2000, 2026))
-    df = fetch_pbp_data(years)
-    df.write_parquet("data/pbp_raw.parquet")  # Polars uses write_parquet
\ No newline at end of file
+    if args.parallel or args.mirror is not None:
+        paths, failed = fetch_pbp_parallel(years, mirror=args.mirror, max_workers=args.workers, retries=args.retries)
+        if not paths:
+            raise SystemExit("No seasons were fetched")
+        if failed:
+            if not args.allow_partial:
+                raise SystemExit(f"Missing seasons {failed}; not overwriting {RAW_PATH} (use --allow-partial to write anyway)")
+            print(f"Writing {RAW_PATH} without seasons {failed}")
+        combine_season_files(paths, RAW_PATH)
+    else:
+        df = fetch_pbp_data(years)
+        df.write_parquet(RAW_PATH)  # Polars uses write_parquet
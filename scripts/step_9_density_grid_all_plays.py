@@ -0,0 +1,89 @@
+import numpy as np
+import polars as pl
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+
+def scan_pbp() -> pl.LazyFrame:
+    return pl.scan_parquet("data/pbp_raw.parquet")
+
+def filter_plays(df: pl.LazyFrame, max_ydstogo=20) -> pl.LazyFrame:
+    # One filtered, narrow frame of every fourth down; all grids are computed from this.
+    # Kept lazy so only these four columns are ever read from the parquet file.
+    return df.filter(
+        (pl.col('down') == 4.0) &
+        (pl.col('ydstogo').is_between(1, max_ydstogo)) &
+        (pl.col('season') >= 2000) &
+        (pl.col('yardline_100').is_not_null())
+    ).select(
+        (100 - pl.col('yardline_100')).alias('field_pos'),
+        pl.col('ydstogo'),
+        pl.col('play_type').is_in(['pass', 'run']).alias('went_for_it'),
+        (pl.col('fourth_down_converted') == 1).fill_null(False).alias('converted')
+    )
+
+def grid_counts(plays: pl.DataFrame, x_bin=2, y_bin=1, x_max=100, y_max=20) -> dict[str, np.ndarray]:
+    # Bin every play into a (ydstogo, field_pos) cell in polars, then scatter the
+    # per-cell counts into dense NumPy arrays. Drawing cost depends on the grid
+    # size only, not on how many plays went in. Plays past the last whole bin
+    # are dropped rather than piled into the edge cell.
+    nx = x_max // x_bin
+    ny = y_max // y_bin
+    cells = plays.with_columns(
+        (pl.col('field_pos') // x_bin).cast(pl.Int64).alias('xi'),
+        ((pl.col('ydstogo') - 1) // y_bin).cast(pl.Int64).alias('yi')
+    ).filter(
+        pl.col('xi').is_between(0, nx - 1) & pl.col('yi').is_between(0, ny - 1)
+    ).group_by(['xi', 'yi']).agg(
+        pl.len().alias('total'),
+        pl.col('went_for_it').sum().alias('goes'),
+        (pl.col('went_for_it') & pl.col('converted')).sum().alias('converted')
+    )
+
+    xi = cells['xi'].to_numpy()
+    yi = cells['yi'].to_numpy()
+    grids = {}
+    for name in ('total', 'goes', 'converted'):
+        grid = np.zeros((ny, nx))
+        grid[yi, xi] = cells[name].to_numpy()
+        grids[name] = grid
+    return grids
+
+def rate_grid(numerator: np.ndarray, denominator: np.ndarray, min_situations=20) -> np.ma.MaskedArray:
+    rate = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+    return np.ma.masked_where(denominator < min_situations, rate)
+
+if __name__ == "__main__":
+    x_bin, y_bin, x_max, y_max = 2, 1, 100, 20
+    plays = filter_plays(scan_pbp(), max_ydstogo=y_max).collect()
+    grids = grid_counts(plays, x_bin=x_bin, y_bin=y_bin, x_max=x_max, y_max=y_max)
+    ny, nx = grids['total'].shape
+    print(f"Binned {len(plays)} plays into a {nx}x{ny} grid")
+
+    go_rate = rate_grid(grids['goes'], grids['total'])
+    conversion_rate = rate_grid(grids['converted'], grids['goes'])
+
+    # Cell edges from the grid itself, so bins that don't divide x_max/y_max stay aligned;
+    # ydstogo bins are centred on whole yards
+    extent = [0, nx * x_bin, 0.5, ny * y_bin + 0.5]
+    fig, axes = plt.subplots(3, 1, figsize=(16, 15), sharex=True)
+
+    density = np.ma.masked_equal(grids['total'], 0)
+    im = axes[0].imshow(density, origin='lower', extent=extent, aspect='auto', cmap='viridis', norm=LogNorm())
+    fig.colorbar(im, ax=axes[0], label='Fourth downs (log scale)')
+    axes[0].set_title('Every Fourth Down, 2000–2025 — Play Density by Field Position and Yards to Go', fontsize=16)
+
+    im = axes[1].imshow(go_rate, origin='lower', extent=extent, aspect='auto', cmap='YlOrRd', vmin=0, vmax=1)
+    fig.colorbar(im, ax=axes[1], label='Go-for-It %', format=plt.FuncFormatter(lambda v, _: f'{v:.0%}'))
+    axes[1].set_title('Go-for-It Rate per Cell (min 20 situations)', fontsize=16)
+
+    im = axes[2].imshow(conversion_rate, origin='lower', extent=extent, aspect='auto', cmap='RdYlGn', vmin=0, vmax=1)
+    fig.colorbar(im, ax=axes[2], label='Conversion %', format=plt.FuncFormatter(lambda v, _: f'{v:.0%}'))
+    axes[2].set_title('Conversion Rate When Going for It (min 20 attempts)', fontsize=16)
+
+    for ax in axes:
+        ax.set_ylabel('Yards to Go', fontsize=14)
+        ax.set_xlim(0, nx * x_bin)
+    axes[2].set_xlabel('Field Position (Left = Deep Own Territory → Right = Near Opponent Goal)', fontsize=14)
+
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,111 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("nflreadpy")
+pl = pytest.importorskip("polars")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import step_1_fetch_data as step_1  # noqa: E402
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    # No real sleeping, and record cache changes instead of touching nflreadpy's global config
+    sleeps, config_updates = [], []
+    monkeypatch.setattr(step_1.time, "sleep", sleeps.append)
+    monkeypatch.setattr(step_1, "get_config", lambda: SimpleNamespace(cache_mode="memory"))
+    monkeypatch.setattr(step_1, "update_config", lambda **kwargs: config_updates.append(kwargs))
+    return SimpleNamespace(sleeps=sleeps, config_updates=config_updates)
+
+
+def season_frame(year):
+    return pl.DataFrame({"season": [year, year], "play_id": [1, 2]})
+
+
+def test_network_fetch_retries_transient_errors(monkeypatch, tmp_path, offline):
+    calls = []
+
+    def flaky_load_pbp(seasons):
+        calls.append(seasons)
+        if len(calls) == 1:
+            raise ConnectionError("connection reset")
+        return season_frame(seasons)
+
+    monkeypatch.setattr(step_1.nfl, "load_pbp", flaky_load_pbp)
+    paths, failed = step_1.fetch_pbp_parallel([2020], out_dir=tmp_path, retries=3)
+
+    assert failed == []
+    assert paths == [tmp_path / "pbp_2020.parquet"]
+    assert calls == [2020, 2020]
+    assert len(offline.sleeps) == 1
+    assert offline.config_updates == [{"cache_mode": "off"}]
+    assert pl.read_parquet(paths[0]).equals(season_frame(2020))
+
+
+def test_network_fetch_reports_season_after_last_retry(monkeypatch, tmp_path, offline):
+    def down_load_pbp(seasons):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(step_1.nfl, "load_pbp", down_load_pbp)
+    paths, failed = step_1.fetch_pbp_parallel([2020], out_dir=tmp_path, retries=2)
+
+    assert paths == []
+    assert failed == [2020]
+    assert len(offline.sleeps) == 1
+
+
+def test_filesystem_cache_is_left_alone(monkeypatch, tmp_path, offline):
+    monkeypatch.setattr(step_1, "get_config", lambda: SimpleNamespace(cache_mode="filesystem"))
+    monkeypatch.setattr(step_1.nfl, "load_pbp", season_frame)
+    step_1.fetch_pbp_parallel([2020], out_dir=tmp_path)
+
+    assert offline.config_updates == []
+
+
+def test_mirror_missing_season_fails_fast(tmp_path, offline):
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    season_frame(2020).write_parquet(mirror / "pbp_2020.parquet")
+
+    paths, failed = step_1.fetch_pbp_parallel([2020, 2021], out_dir=tmp_path / "out", mirror=mirror)
+
+    assert paths == [tmp_path / "out" / "pbp_2020.parquet"]
+    assert failed == [2021]
+    assert offline.sleeps == []
+
+
+def test_mirror_in_place_leaves_files_untouched(tmp_path, offline):
+    season_frame(2020).write_parquet(tmp_path / "pbp_2020.parquet")
+    before = (tmp_path / "pbp_2020.parquet").read_bytes()
+
+    paths, failed = step_1.fetch_pbp_parallel([2020], out_dir=tmp_path, mirror=tmp_path)
+
+    assert failed == []
+    assert paths[0].read_bytes() == before
+
+
+def test_combine_fills_missing_columns(tmp_path):
+    season_frame(2020).write_parquet(tmp_path / "pbp_2020.parquet")
+    season_frame(2021).with_columns(pl.lit(1.0).alias("epa")).write_parquet(tmp_path / "pbp_2021.parquet")
+    out_path = tmp_path / "pbp_raw.parquet"
+
+    step_1.combine_season_files([tmp_path / "pbp_2020.parquet", tmp_path / "pbp_2021.parquet"], out_path)
+
+    combined = pl.read_parquet(out_path)
+    assert combined.shape == (4, 3)
+    assert combined["epa"].null_count() == 2
+
+
+def test_failed_combine_keeps_previous_output(tmp_path):
+    out_path = tmp_path / "pbp_raw.parquet"
+    season_frame(2019).write_parquet(out_path)
+    before = out_path.read_bytes()
+
+    with pytest.raises(Exception):
+        step_1.combine_season_files([tmp_path / "missing.parquet"], out_path)
+
+    assert out_path.read_bytes() == before
+    assert not (tmp_path / "pbp_raw.parquet.tmp").exists()